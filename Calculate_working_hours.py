@@ -1,15 +1,19 @@
 #!/usr/bin/python
-from datetime import datetime, date, time
+from datetime import datetime, date, timedelta
+import numpy as np
 import pandas as pd
 import tkinter as tk
 from tkinter import filedialog
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import Dict, List, Optional, Set
 import logging
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 import json
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 
 # 配置日志
@@ -19,19 +23,52 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
-class TimeConfig:
-    """时间配置类"""
-    WORK_START = time(8, 30)
-    WORK_LATE = time(9, 30)
-    WORK_END = time(18, 0)
-    WORK_END_FLEX = time(18, 30)
-    STANDARD_WORK_MINUTES = 570  # 9.5小时
-    OVERTIME_WORK_MINUTES = 600  # 10小时
+# 时间配置（时间点均为当天零点起的分钟数）
+WORK_START_MIN = 510          # 08:30
+WORK_LATE_MIN = 570           # 09:30
+WORK_END_MIN = 1080           # 18:00
+WORK_END_FLEX_MIN = 1110      # 18:30
+STANDARD_WORK_MINUTES = 570   # 9.5小时
+OVERTIME_WORK_MINUTES = 600   # 10小时
+
+# 节假日写入语句，各处复用同一条 SQL 以命中 sqlite3 的语句缓存
+_INSERT_HOLIDAY_SQL = 'INSERT OR REPLACE INTO holidays VALUES (?, ?, ?, ?)'
+
+def _fast_date(date_str: str) -> date:
+    """按固定位置切片解析 YYYY?MM?DD 格式的日期，避免 strptime 的区域设置和正则开销"""
+    return date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+
+def _full_holiday_date(date_str: str, year: int) -> str:
+    """补全接口返回的 MM-DD 日期为 YYYY-MM-DD"""
+    return date_str if len(date_str) >= 10 else f"{year}-{date_str}"
+
+def _holiday_row(date_str: str, info: dict, year: int) -> tuple:
+    """生成一条节假日记录，日期无效时抛出 ValueError"""
+    date_str = _full_holiday_date(date_str, year)
+    _fast_date(date_str)  # 验证日期格式
+    return (date_str, 'holiday' if info['holiday'] else 'workday', info.get('name', ''), year)
+
+def _holiday_rows(data: dict, year: int) -> list:
+    """将接口数据转换为数据库记录，跳过日期无效的条目"""
+    items = data.get('holiday', {}).items()
+    try:
+        return [_holiday_row(date_str, info, year) for date_str, info in items]
+    except ValueError:
+        # 存在无效日期时逐条处理，只跳过无效的条目
+        rows = []
+        for date_str, info in items:
+            try:
+                rows.append(_holiday_row(date_str, info, year))
+            except ValueError:
+                logger.warning(f"跳过无效日期格式: {date_str}")
+        return rows
 
 @dataclass
 class AttendanceResult:
     """考勤结果类"""
+    __slots__ = ('name', 'month', 'overtime_hours', 'missing_clockout_dates',
+                 'late_count', 'start_date', 'end_date', 'valid_days')
+
     name: str                      
     month: str                     
     overtime_hours: float
@@ -68,14 +105,39 @@ class HolidayCalendar:
             
             self.holidays = set()
             self.workdays = set()
+            self._workday_cache: Dict[date, bool] = {}
+            # 节假日数据按年份在首次查询时加载
+            self._loaded_years: Set[int] = set()
             
+            self._conn = self._connect()
+            self._session = self._create_session()
             self._init_database()
-            self._load_all_data()
             HolidayCalendar._initialized = True
 
+    def _connect(self) -> sqlite3.Connection:
+        """打开共享的数据库连接并设置性能参数"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-20000')
+        return conn
+
+    def _create_session(self) -> requests.Session:
+        """创建复用连接并带重试的HTTP会话"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
     def _init_database(self):
         """初始化数据库"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         cursor = conn.cursor()
         
         # 创建节假日表
@@ -88,82 +150,85 @@ class HolidayCalendar:
             )
         ''')
         
+        # 按年份查询时走索引，避免全表扫描
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_holidays_year ON holidays(year)')
+        
         conn.commit()
-        conn.close()
 
     def _fetch_holiday_data(self, year: int) -> dict:
         """从API获取节假日数据"""
         url = f'http://timor.tech/api/holiday/year/{year}'
-        response = requests.get(url, timeout=5)
+        headers = {}
+        etag = self._load_etag(year)
+        if etag:
+            headers['If-None-Match'] = etag
+            
+        response = self._session.get(url, headers=headers, timeout=5)
+        if response.status_code == 304:
+            # 数据未变化，直接使用本地缓存
+            cache_data = self._load_from_cache(year)
+            if cache_data:
+                return cache_data
+            # 缓存不可用时删除ETag，重新完整下载
+            self._save_etag(year, None)
+            response = self._session.get(url, timeout=5)
         if response.status_code == 200:
             data = response.json()
-            self._save_to_cache(year, data)  # 保存到缓存
+            # 只有缓存写入成功时才保存ETag，否则清除旧的ETag
+            saved = self._save_to_cache(year, data)
+            self._save_etag(year, response.headers.get('ETag') if saved else None)
             return data
         return None
     
     def is_workday(self, date_obj: date) -> bool:
         """判断是否为工作日"""
+        cached = self._workday_cache.get(date_obj)
+        if cached is not None:
+            return cached
+
+        if date_obj.year not in self._loaded_years:
+            self._load_year(date_obj.year)
+
         if date_obj in self.holidays:
-            return False
-        if date_obj in self.workdays:
-            return True
-        return date_obj.weekday() < 5
+            result = False
+        elif date_obj in self.workdays:
+            result = True
+        else:
+            result = date_obj.weekday() < 5
+        self._workday_cache[date_obj] = result
+        return result
     
-    def _load_all_data(self):
-        """加载所有数据"""
-        current_year = datetime.now().year
-        years_to_load = range(current_year - 1, current_year + 2)
+    def _load_year(self, year: int):
+        """加载指定年份的数据"""
+        self._loaded_years.add(year)
         
         # 首先尝试从数据库加载
-        for year in years_to_load:
-            if self._load_from_database(year):
-                continue
-                
-            # 如果数据库没有数据，尝试从缓存加载
-            cache_data = self._load_from_cache(year)
-            if cache_data:
-                self._save_to_database(year, cache_data)
-                self._load_from_database(year)
+        if self._load_from_database(year):
+            return
+            
+        # 如果数据库没有数据，尝试从缓存加载
+        cache_data = self._load_from_cache(year)
+        if cache_data:
+            self._save_to_database(year, cache_data)
+            self._load_from_database(year)
 
     def _save_to_database(self, year: int, data: dict):
         """保存数据到数据库"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         cursor = conn.cursor()
         
         try:
-            holiday_data = []
-            for date_str, info in data.get('holiday', {}).items():
-                try:
-                    # 确保日期格式正确
-                    if len(date_str.split('-')) == 2:
-                        date_str = f"{year}-{date_str}"
-                    datetime.strptime(date_str, '%Y-%m-%d')  # 验证日期格式
-                    
-                    holiday_data.append(
-                        (date_str, 'holiday' if info['holiday'] else 'workday', 
-                         info.get('name', ''), year)
-                    )
-                except ValueError:
-                    logger.warning(f"跳过无效日期格式: {date_str}")
-                    continue
-            
-            cursor.executemany(
-                'INSERT OR REPLACE INTO holidays VALUES (?, ?, ?, ?)',
-                holiday_data
-            )
+            cursor.executemany(_INSERT_HOLIDAY_SQL, _holiday_rows(data, year))
             conn.commit()
             
         except Exception as e:
             logger.error(f"保存数据到数据库失败: {e}")
             conn.rollback()
-        finally:
-            conn.close()
 
     def _load_from_database(self, year: int) -> bool:
         """从数据库加载特定年份的节假日数据"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            cursor = self._conn.cursor()
             
             # 一次性获取所有数据
             cursor.execute("""
@@ -174,26 +239,37 @@ class HolidayCalendar:
             """, (year,))
             
             results = cursor.fetchall()
-            conn.close()
             
             if not results:
                 return False
                 
-            # 批量处理数据
-            for date_str, type_ in results:
-                try:
-                    # 确保日期字符串包含年份
-                    if len(date_str.split('-')) == 2:
-                        date_str = f"{year}-{date_str}"
-                    
-                    date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
+
+            # 批量处理数据（兼容旧数据中不含年份的日期）
+            try:
+                holidays = {
+                    _fast_date(_full_holiday_date(date_str, year))
+                    for date_str, type_ in results if type_ == 'holiday'
+                }
+                workdays = {
+                    _fast_date(_full_holiday_date(date_str, year))
+                    for date_str, type_ in results if type_ == 'workday'
+                }
+            except ValueError:
+                # 存在无效日期时逐条处理，只跳过无效的记录
+                holidays, workdays = set(), set()
+                for date_str, type_ in results:
+                    try:
+                        date_obj = _fast_date(_full_holiday_date(date_str, year))
+                    except ValueError as e:
+                        logger.warning(f"跳过无效日期格式: {date_str}, 错误: {e}")
+                        continue
                     if type_ == 'holiday':
-                        self.holidays.add(date_obj)
+                        holidays.add(date_obj)
                     else:
-                        self.workdays.add(date_obj)
-                except ValueError as e:
-                    logger.warning(f"跳过无效日期格式: {date_str}, 错误: {e}")
-                    continue
+                        workdays.add(date_obj)
+            
+            self.holidays.update(holidays)
+            self.workdays.update(workdays)
             
             return True
             
@@ -206,49 +282,83 @@ class HolidayCalendar:
         current_year = datetime.now().year
         years_to_update = range(current_year - 1, current_year + 2)
         
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn
         cursor = conn.cursor()
         
         try:
-            for year in years_to_update:
-                api_data = self._fetch_holiday_data(year)
+            # 并发请求各年份的数据，单个年份失败不影响其他年份
+            with ThreadPoolExecutor(max_workers=len(years_to_update)) as executor:
+                futures = {
+                    year: executor.submit(self._fetch_holiday_data, year)
+                    for year in years_to_update
+                }
+            
+            all_rows = []
+            updated_years = set()
+            for year, future in futures.items():
+                try:
+                    api_data = future.result()
+                except Exception as e:
+                    logger.error(f"获取{year}年节假日数据失败: {e}")
+                    continue
                 if not api_data:
                     continue
                     
-                # 批量插入数据
-                holiday_data = [
-                    (date_str, 'holiday' if info['holiday'] else 'workday', 
-                     info.get('name', ''), year)
-                    for date_str, info in api_data.get('holiday', {}).items()
-                ]
-                
-                cursor.executemany(
-                    'INSERT OR REPLACE INTO holidays VALUES (?, ?, ?, ?)',
-                    holiday_data
-                )
+                updated_years.add(year)
+                all_rows.extend(_holiday_rows(api_data, year))
             
+            # 所有年份一次性批量插入，放在同一个事务中
+            cursor.execute('BEGIN')
+            cursor.executemany(_INSERT_HOLIDAY_SQL, all_rows)
             conn.commit()
             
-            # 重新加载数据
-            self.holidays.clear()
-            self.workdays.clear()
-            for year in years_to_update:
-                self._load_from_database(year)
+            # 直接用内存中的数据重建节假日集合，无需重新查询数据库
+            self.holidays = {d for d in self.holidays if d.year not in updated_years}
+            self.workdays = {d for d in self.workdays if d.year not in updated_years}
+            self._workday_cache.clear()
+            self._loaded_years.update(updated_years)
+            for date_str, type_, _, _ in all_rows:
+                if type_ == 'holiday':
+                    self.holidays.add(_fast_date(date_str))
+                else:
+                    self.workdays.add(_fast_date(date_str))
                 
         except Exception as e:
             logger.error(f"更新节假日数据失败: {e}")
             conn.rollback()
-        finally:
-            conn.close()
 
-    def _save_to_cache(self, year: int, data: dict):
-        """保存数据到缓存文件"""
+    def _save_to_cache(self, year: int, data: dict) -> bool:
+        """保存数据到缓存文件，返回是否保存成功"""
         cache_file = self.cache_dir / f'holiday_{year}.json'
         try:
             with open(cache_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False)
+            return True
         except Exception as e:
             logger.error(f"保存缓存数据失败: {e}")
+            return False
+
+    def _save_etag(self, year: int, etag: Optional[str]):
+        """保存缓存数据对应的ETag"""
+        etag_file = self.cache_dir / f'holiday_{year}.etag'
+        try:
+            if etag:
+                etag_file.write_text(etag, encoding='utf-8')
+            elif etag_file.exists():
+                etag_file.unlink()
+        except Exception as e:
+            logger.error(f"保存ETag失败: {e}")
+
+    def _load_etag(self, year: int) -> Optional[str]:
+        """加载缓存数据对应的ETag，缓存文件不存在时返回None"""
+        etag_file = self.cache_dir / f'holiday_{year}.etag'
+        cache_file = self.cache_dir / f'holiday_{year}.json'
+        try:
+            if etag_file.exists() and cache_file.exists():
+                return etag_file.read_text(encoding='utf-8').strip()
+        except Exception as e:
+            logger.error(f"加载ETag失败: {e}")
+        return None
 
     def _load_from_cache(self, year: int) -> Optional[dict]:
         """从缓存文件加载数据"""
@@ -264,94 +374,98 @@ class HolidayCalendar:
 class TimeParser:
     """时间解析类"""
     @staticmethod
-    def parse_time(time_str: str) -> Optional[time]:
-        """解析时间字符串"""
-        try:
-            return datetime.strptime(time_str, '%H:%M').time()
-        except ValueError:
-            return None
-
-    @staticmethod
-    def parse_next_day_time(time_str: str) -> int:
-        """解析次日时间"""
-        time_str = time_str.replace("次日", "")
-        time_obj = datetime.strptime(time_str, '%H:%M')
-        return time_obj.hour * 60 + time_obj.minute
-
-    @staticmethod
-    def compute_minutes(start_time: str, end_time: str) -> int:
-        """计算时间差（分钟）"""
-        start_dt = datetime.strptime(start_time, "%H:%M")
-        end_dt = datetime.strptime(end_time, "%H:%M")
-        diff = end_dt - start_dt
-        return int(diff.total_seconds() / 60)
+    def to_minutes(time_col: pd.Series) -> np.ndarray:
+        """批量将字符串类型的 HH:MM（可带“次日”前缀）时间列转换为分钟数，无法解析的记为 NaN"""
+        parts = time_col.str.extract(r'(\d{1,2}):(\d{2})').astype(float)
+        return (parts[0] * 60 + parts[1]).to_numpy()
 
 class AttendanceAnalyzer:
     """考勤分析类"""
     def __init__(self):
-        self.time_config = TimeConfig()
         self.calendar = HolidayCalendar()
         self.time_parser = TimeParser()
 
     def analyze_attendance(self, file_path: str) -> AttendanceResult:
         """分析考勤数据"""
         try:
-            df = pd.read_excel(file_path)
-            selected_data = df.iloc[3:, [0, 8, 9, 10, 14]]
-            selected_data = selected_data.iloc[::-1]
+            # 只读取需要的列（日期、姓名、上班、下班、打卡次数、考勤结果），跳过表头
+            df = pd.read_excel(
+                file_path,
+                usecols=[0, 1, 8, 9, 10, 14],
+                skiprows=4,
+                header=None,
+                engine='openpyxl',
+                dtype=str
+            )
+            selected_data = df.iloc[::-1, [0, 2, 3, 4, 5]]
 
             try:
-                name = df.iloc[3, 1]
-                month_str = df.iloc[3, 0].split()[0]
-                date_obj = datetime.strptime(month_str, '%Y/%m/%d')
-                month = f"{date_obj.month:02d}"
-            except:
+                name = df.iloc[0, 1]
+            except IndexError:
                 name = ""
-                month = ""
-
-            total_overtime = 0
-            missing_clockout = []
-            late_count = 0
-            valid_days = 0
-
-            first_date = datetime.strptime(
-                selected_data.iloc[0, 0].split()[0], 
-                '%Y/%m/%d'
-            ).date()
-            last_date = datetime.strptime(
-                selected_data.iloc[-1, 0].split()[0], 
-                '%Y/%m/%d'
-            ).date()
-
-            for _, row in selected_data.iterrows():
-                date_str = row[0].split()[0]
-                date_obj = datetime.strptime(date_str, '%Y/%m/%d').date()
-                
-                punch_count = row[3]        # 打卡次数
-                start_time = row[1]         # 开始时间
-                end_time = row[2]           # 结束时间
-                
-                # 使用日历判断是否为工作日（已经考虑了调休情况）
-                is_workday = self.calendar.is_workday(date_obj)
-                
-                has_actual_punch = (pd.notna(start_time) and pd.notna(end_time) and 
-                                str(start_time) != str(end_time))
-                
-                # 统计有效打卡天数（包括工作日和非工作日）
-                if pd.notna(punch_count) and punch_count == "2次":
-                    if is_workday or (not is_workday and has_actual_punch):
-                        valid_days += 1
-                        logger.debug(f"有效打卡日期: {date_str}, 是否工作日: {is_workday}")
-                
-                # 只计算工作日的加班时间
-                overtime, is_late, missing = self._process_record(row)
-                if is_workday:  # 只累计工作日的加班时间
-                    total_overtime += overtime
-                    late_count += is_late
-                if missing:
-                    missing_clockout.append(missing)
 
-            missing_clockout.sort(reverse=True)
+            date_col, punch_col, status_col = (selected_data.iloc[:, i] for i in (0, 3, 4))
+            # 上下班时间统一转换为字符串类型，后续比较和解析无需再逐个转换
+            start_col, end_col = (selected_data.iloc[:, i].astype('string') for i in (1, 2))
+
+            # 按列批量解析日期和时间，避免逐行处理
+            dates = pd.to_datetime(
+                date_col.str.split().str[0], format='%Y/%m/%d', cache=True
+            ).dt.date.to_numpy()
+            # 数据已按时间正序排列，首尾即统计期间；月份取最新一条记录
+            first_date = dates[0]
+            last_date = dates[-1]
+            month = f"{last_date.month:02d}"
+            start_min = self.time_parser.to_minutes(start_col)
+            end_min = self.time_parser.to_minutes(end_col)
+            is_next_day = end_col.str.contains("次日", na=False).to_numpy()
+
+            # 使用日历判断是否为工作日（已经考虑了调休情况）
+            range_start = min(dates)
+            bitmap = self._workday_bitmap(range_start, max(dates))
+            is_workday_arr = np.array(
+                [(bitmap >> (d - range_start).days) & 1 for d in dates], dtype=bool
+            )
+
+            has_start = start_col.notna().to_numpy()
+            same_punch = (start_col == end_col).fillna(False).to_numpy(dtype=bool)
+            has_actual_punch = has_start & end_col.notna().to_numpy() & ~same_punch
+            two_punches = (punch_col == "2次").to_numpy()
+
+            # 统计有效打卡天数（包括工作日和非工作日）
+            valid_days = int((two_punches & (is_workday_arr | has_actual_punch)).sum())
+
+            # 如果是当天的记录且开始时间等于结束时间，说明还在上班，跳过计算
+            still_working = has_start & same_punch
+
+            # 检查考勤状态、打卡次数以及打卡时间是否完整
+            missing_mask = ~still_working & (
+                (status_col != "正常").to_numpy()
+                | (punch_col.notna().to_numpy() & ~two_punches)
+                | np.isnan(start_min)
+                | np.isnan(end_min)
+            )
+            # 只计算工作日的加班时间和迟到次数
+            counted = ~still_working & ~missing_mask & is_workday_arr
+
+            overtime_arr = np.where(
+                is_next_day,
+                end_min + 1 + (23 * 60 + 59 - start_min) - OVERTIME_WORK_MINUTES,
+                np.where(
+                    end_min <= WORK_END_FLEX_MIN,
+                    WORK_END_MIN - start_min - STANDARD_WORK_MINUTES,
+                    end_min - start_min - OVERTIME_WORK_MINUTES
+                )
+            )
+            total_overtime = float(np.where(counted, overtime_arr, 0).sum())
+
+            late_mask = counted & (start_min > WORK_START_MIN) & \
+                (start_min <= WORK_LATE_MIN)
+            late_count = int(late_mask.sum())
+
+            today = date.today()
+            # 日期列已是时间正序，倒序即为从新到旧，无需再排序
+            missing_clockout = [d for d in dates[missing_mask][::-1] if d != today]
 
             return AttendanceResult(
                 name=name,
@@ -368,65 +482,12 @@ class AttendanceAnalyzer:
             logger.error(f"分析考勤数据时出错: {e}")
             raise
 
-    def _process_record(self, row) -> Tuple[float, bool, Optional[date]]:
-        """处理单条考勤记录"""
-        date_str = row[0].split()[0]
-        date_obj = datetime.strptime(date_str, '%Y/%m/%d').date() #  将日期字符串转换为日期对象
-        
-        # 判断是否为工作日
-        is_workday = self.calendar.is_workday(date_obj)
-
-        start_time = row[1]
-        end_time = str(row[2])
-        work_status = row[4]
-        punch_count = row[3]
-        
-        # 如果是当天的记录且开始时间等于结束时间，说明还在上班，跳过计算
-        if end_time == start_time:
-            return 0, False, None
-        
-        # 检查考勤状态和打卡次数
-        if work_status != "正常" or (pd.notna(punch_count) and punch_count != "2次"):
-            return 0, False, date_obj if date_obj != date.today() else None
-
-            
-        # 计算加班时间
-        if pd.isna(start_time) or pd.isna(end_time):
-            return 0, False, date_obj if date_obj != date.today() else None
-            
-        # 传入是否工作日的标志
-        return self._calculate_overtime(start_time, end_time, is_workday), \
-            self._is_late(start_time) if is_workday else False, \
-            None
-
-    def _is_before_time(self, time_str: str, target: time) -> bool:
-        """判断是否早于某个时间点"""
-        time_obj = self.time_parser.parse_time(time_str)
-        return time_obj and time_obj <= target
-
-    def _is_late(self, time_str: str) -> bool:
-        """判断是否迟到"""
-        time_obj = self.time_parser.parse_time(time_str)
-        return time_obj and self.time_config.WORK_START < time_obj <= self.time_config.WORK_LATE
-
-    def _calculate_overtime(self, start_time: str, end_time: str, is_workday: bool = True) -> float:
-        """计算加班时间"""
-        # 非工作日不计算剩余工时
-        if not is_workday:
-            return 0
-            
-        if "次日" in end_time:
-            return self.time_parser.parse_next_day_time(end_time) + 1 +\
-                self.time_parser.compute_minutes(start_time, "23:59") - \
-                self.time_config.OVERTIME_WORK_MINUTES
-
-        if self._is_before_time(end_time, self.time_config.WORK_END_FLEX):
-            work_minutes = self.time_config.STANDARD_WORK_MINUTES
-            end_time = "18:00"
-        else:
-            work_minutes = self.time_config.OVERTIME_WORK_MINUTES
-            
-        return self.time_parser.compute_minutes(start_time, end_time) - work_minutes
+    def _workday_bitmap(self, start_date: date, end_date: date) -> int:
+        """生成统计期间的工作日位图，第i位表示start_date之后第i天是否为工作日"""
+        bitmap = 0
+        for i in range((end_date - start_date).days + 1):
+            bitmap |= self.calendar.is_workday(start_date + timedelta(days=i)) << i
+        return bitmap
 
 def main():
     root = tk.Tk()
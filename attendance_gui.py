@@ -26,67 +26,56 @@ class DisplayData:
 
 class CustomProgressBar(tk.Canvas):
     """自定义进度条，带刻度线和标记"""
+    # 进度条的刻度点（小时）及其在进度条上的位置比例（满刻度50小时）
+    SCALE_POINTS = tuple((point, point / 50) for point in (22, 25, 28, 32, 35, 40, 45))
+    # 进度条对应的天数值和标签位置比例
+    # 1天: 22-28, 2天: 28-35, 3天: 35-45, 4天: 45-50
+    DAY_MARKERS = ((1, 24 / 50), (2, 30 / 50), (3, 38 / 50), (4, 48 / 50))
+
     def __init__(self, master, width=350, height=60, **kwargs):  # 缩短进度条宽度
         super().__init__(master, width=width, height=height, **kwargs)
         self.configure(highlightthickness=0, bg='white')
         self.width = width
         self.height = height
         self.bar_height = 30
+        self.scale_width = width - 20
         self.value = 0
         
-        # 进度条的刻度点（小时）
-        self.scale_points = [22, 25, 28, 32, 35, 40, 45]
-        # 进度条对应的天数值和位置
-        self.day_markers = [
-            {"value": 1, "start": 22, "end": 28, "position": 24},
-            {"value": 2, "start": 28, "end": 35, "position": 30},
-            {"value": 3, "start": 35, "end": 45, "position": 38},
-            {"value": 4, "start": 45, "end": 50, "position": 48}
-        ]
-        
         self.create_base_elements()
         
     def create_base_elements(self):
         """创建基础元素"""
+        bar_top = 10
+        bar_bottom = 10 + self.bar_height
+        
         # 绘制进度条边框 - 使用黑色边框
-        self.create_rectangle(10, 10, self.width-10, 10+self.bar_height, 
+        self.create_rectangle(10, bar_top, self.width-10, bar_bottom, 
                             outline='black', width=1, fill='white')
         
-        # 绘制刻度线和标签
-        scale_width = self.width - 20
-        
         # 绘制天数标记（在进度条内部，错开竖线位置）
-        for marker in self.day_markers:
-            # 计算标记位置 - 错开竖线
-            x_pos = 10 + (marker["position"] / 50) * scale_width
-            
-            # 绘制天数标签（在进度条内部）
-            self.create_text(x_pos, 10 + self.bar_height/2, 
-                           text=str(marker["value"]), fill='black', font=('SimHei', 10))
+        for value, ratio in self.DAY_MARKERS:
+            self.create_text(10 + ratio * self.scale_width, bar_top + self.bar_height/2, 
+                           text=str(value), fill='black', font=('SimHei', 10))
         
-        # 绘制小时刻度线和标签（在进度条下方）
-        for point in self.scale_points:
-            # 计算刻度线位置
-            x_pos = 10 + (point / 50) * scale_width
-            
-            # 绘制刻度线 - 从进度条内部延伸到下方，使用黑色
-            self.create_line(x_pos, 10, x_pos, 10+self.bar_height, 
-                           fill='black', width=1)
-            
-            # 绘制小时标签 - 在进度条下方，使用黑色
-            self.create_text(x_pos, 10+self.bar_height+10, 
+        # 绘制小时刻度线（从进度条内部延伸到下方）和标签（在进度条下方）
+        for point, ratio in self.SCALE_POINTS:
+            x_pos = 10 + ratio * self.scale_width
+            self.create_line(x_pos, bar_top, x_pos, bar_bottom, fill='black', width=1)
+            self.create_text(x_pos, bar_bottom + 10, 
                            text=str(point), fill='black', font=('SimHei', 8))
+        
+        # 进度条填充只创建一次，更新时调整坐标即可
+        self._progress_id = self.create_rectangle(10, bar_top, 10, bar_bottom, 
+                                                outline='', fill='#4a86e8', tags="progress")
     
     def update_value(self, hours):
         """更新进度条值"""
-        self.delete("progress")
-        
         if hours <= 0:
+            self.coords(self._progress_id, 10, 10, 10, 10+self.bar_height)
             return 0
             
         # 计算进度条宽度
-        scale_width = self.width - 20
-        bar_width = min((hours / 50) * scale_width, scale_width)
+        bar_width = min((hours / 50) * self.scale_width, self.scale_width)
         
         # 根据小时数计算天数值
         day_value = 0
@@ -99,10 +88,8 @@ class CustomProgressBar(tk.Canvas):
         elif hours >= 22:
             day_value = 1
             
-        # 绘制进度条填充
-        if bar_width > 0:
-            self.create_rectangle(10, 10, 10 + bar_width, 10+self.bar_height, 
-                                outline='', fill='#4a86e8', tags="progress")
+        # 更新进度条填充
+        self.coords(self._progress_id, 10, 10, 10 + bar_width, 10+self.bar_height)
             
         return day_value
 